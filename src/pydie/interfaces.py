@@ -1,5 +1,7 @@
-from typing import TypedDict, Protocol, Optional
-from polars import DataFrame
+from typing import TypedDict, Protocol, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from polars import DataFrame
 
 
 type SQLTableName = str
@@ -23,7 +25,7 @@ class ConverterConfiguration(TypedDict):
 
     id: ConverterID
     target_table: SQLTableName
-    data: dict | DataFrame
+    data: "dict | DataFrame"
 
 
 class EngineConfiguration(TypedDict):
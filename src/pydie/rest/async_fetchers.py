@@ -0,0 +1,221 @@
+import asyncio
+import pydie.rest.interfaces as rest
+from aiohttp import ClientSession, TCPConnector
+from pydie.rest.fetchers import (
+    FetchError,
+    DEFAULT_CONCURRENCY,
+    path_maker,
+    headers_maker,
+    decode_json,
+    encode_json,
+    dependency_extractor,
+    get_data_at_address,
+    static_dependent_paths,
+    converter_configuration_maker,
+)
+
+
+async def fetcher_async(
+    connection: rest.FetcherConfiguration,
+    engine: rest.EngineConfiguration,
+    session: ClientSession,
+) -> rest.ConverterConfiguration:
+    """Asynchronous counterpart of `pydie.rest.fetchers.fetcher`.
+
+    :param rest.FetcherConfiguration connection: particular API path endpiont to connect to
+    :param rest.EngineConfiguration engine: general REST API configurations
+    :param ClientSession session: session the request is issued through
+    :raises FetchError: on non-2xx `status_code`
+    :return rest.ConverterConfiguration: specifications to be fed into a converter
+    """
+    url = path_maker(
+        base_url=engine["base_url"],
+        path=connection["path"],
+        path_parameters=connection.get("parametrizable_values"),
+    )
+
+    request_function_parameters = connection.get("request_function_parameters", {})
+
+    async with session.request(
+        connection["request_function_name"].upper(),
+        url,
+        headers=headers_maker(connection=connection, engine=engine),
+        params=request_function_parameters.get("parameters"),
+        json=request_function_parameters.get("json"),
+    ) as response:
+        if not 200 <= response.status < 300:
+            raise FetchError(
+                url=url, status_code=response.status, reason=response.reason
+            )
+        response_data = (
+            None if response.status == 204 else decode_json(await response.read())
+        )
+
+    return converter_configuration_maker(
+        connection=connection,
+        response_data=get_data_at_address(
+            data=response_data, address=connection.get("top_level_data_address")
+        ),
+    )
+
+
+def session_maker(concurrency: int) -> ClientSession:
+    """Creates a pooled session allowing at most `concurrency` open connections.
+
+    :param int concurrency: maximum number of open connections
+    :return ClientSession:
+    """
+    return ClientSession(
+        connector=TCPConnector(
+            limit=concurrency, ttl_dns_cache=300, keepalive_timeout=75
+        ),
+        json_serialize=lambda data: encode_json(data).decode(),
+    )
+
+
+async def gather_fetches(
+    connections: list[rest.FetcherConfiguration],
+    engine: rest.EngineConfiguration,
+    session: ClientSession,
+    semaphore: asyncio.Semaphore,
+) -> list[rest.ConverterConfiguration | None]:
+    """Fetches all `connections` concurrently, holding `semaphore` for each request.
+
+    Like `fetcher_or_none`, requests failing with `FetchError` yield `None` instead of aborting their siblings.
+    Any other exception is raised once every request has finished.
+
+    :param list[rest.FetcherConfiguration] connections: endpoints to fetch
+    :param rest.EngineConfiguration engine: general REST API configurations
+    :param ClientSession session: session the requests are issued through
+    :param asyncio.Semaphore semaphore: bounds the number of requests in flight
+    :return list[rest.ConverterConfiguration | None]: converter configurations, in the same order as `connections`, `None` for failed requests
+    """
+
+    async def bounded_fetch(connection: rest.FetcherConfiguration):
+        async with semaphore:
+            return await fetcher_async(
+                connection=connection, engine=engine, session=session
+            )
+
+    results = await asyncio.gather(
+        *[bounded_fetch(connection) for connection in connections],
+        return_exceptions=True,
+    )
+    for result in results:
+        if isinstance(result, BaseException) and not isinstance(result, FetchError):
+            raise result
+    return [None if isinstance(result, FetchError) else result for result in results]
+
+
+async def fetch_many(
+    connections: list[rest.FetcherConfiguration],
+    engine: rest.EngineConfiguration,
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> list[rest.ConverterConfiguration | None]:
+    """Fetches all `connections` concurrently over a single pooled session.
+
+    :param list[rest.FetcherConfiguration] connections: endpoints to fetch
+    :param rest.EngineConfiguration engine: general REST API configurations
+    :param int concurrency: maximum number of requests in flight, defaults to `DEFAULT_CONCURRENCY`
+    :return list[rest.ConverterConfiguration | None]: converter configurations, in the same order as `connections`, `None` for failed requests, see `gather_fetches`
+    """
+    async with session_maker(concurrency) as session:
+        return await gather_fetches(
+            connections=connections,
+            engine=engine,
+            session=session,
+            semaphore=asyncio.Semaphore(concurrency),
+        )
+
+
+async def fetch_all(
+    connections: list[rest.FetcherConfiguration],
+    engine: rest.EngineConfiguration,
+) -> list[rest.ConverterConfiguration]:
+    """Fetches `connections` and, level by level, every request depending on them.
+
+    All requests of a level are independent of each other and run concurrently;
+    the next level is made of the dependent requests extracted from the previous one.
+    Unless the engine disables `prefetch`, dependent GET requests that are not parametrized by their
+    parent's response are fetched in the same level as the parent, see `with_static_dependents`.
+    Failed requests are skipped along with the requests depending on their response, see `gather_fetches`.
+
+    :param list[rest.FetcherConfiguration] connections: top level endpoints to fetch
+    :param rest.EngineConfiguration engine: general REST API configurations
+    :return list[rest.ConverterConfiguration]: converter configurations of every successful request
+    """
+    concurrency = engine.get("default_concurrency") or DEFAULT_CONCURRENCY
+    semaphore = asyncio.Semaphore(concurrency)
+    prefetch = engine.get("prefetch", True)
+    converter_configurations: list[rest.ConverterConfiguration] = []
+
+    async with session_maker(concurrency) as session:
+        while connections:
+            if prefetch:
+                connections = with_static_dependents(connections)
+            level = await gather_fetches(
+                connections=connections,
+                engine=engine,
+                session=session,
+                semaphore=semaphore,
+            )
+            converter_configurations.extend(
+                converter_configuration
+                for converter_configuration in level
+                if converter_configuration is not None
+            )
+            connections = [
+                dependent
+                for connection, converter_configuration in zip(connections, level)
+                if converter_configuration is not None
+                for dependent in dependency_extractor(
+                    converter_configuration,
+                    paths=(
+                        set(connection.get("dependent_requests") or {})
+                        - static_dependent_paths(connection)
+                        if prefetch
+                        else None
+                    ),
+                )
+            ]
+
+    return converter_configurations
+
+
+def with_static_dependents(
+    connections: list[rest.FetcherConfiguration],
+) -> list[rest.FetcherConfiguration]:
+    """Adds, recursively, the dependent GET requests of `connections` that do not depend on their parent's response.
+
+    :param list[rest.FetcherConfiguration] connections: endpoints to fetch
+    :return list[rest.FetcherConfiguration]: `connections` followed by their static dependents
+    """
+    connections = list(connections)
+    index = 0
+    while index < len(connections):
+        connection = connections[index]
+        connections.extend(
+            dependency_extractor(
+                {"dependent_requests": connection.get("dependent_requests")},
+                paths=static_dependent_paths(connection),
+            )
+        )
+        index += 1
+    return connections
+
+
+async def fetch_dependencies(
+    converter_configuration: rest.ConverterConfiguration,
+    engine: rest.EngineConfiguration,
+) -> list[rest.ConverterConfiguration | None]:
+    """Fetches every dependent request of `converter_configuration` concurrently.
+
+    :param rest.ConverterConfiguration converter_configuration: converter configuration output from a fetcher
+    :param rest.EngineConfiguration engine: general REST API configurations
+    :return list[rest.ConverterConfiguration | None]: converter configurations of the dependent requests, `None` for failed requests
+    """
+    return await fetch_many(
+        connections=dependency_extractor(converter_configuration),
+        engine=engine,
+        concurrency=engine.get("default_concurrency") or DEFAULT_CONCURRENCY,
+    )
@@ -0,0 +1,83 @@
+import json
+from time import monotonic
+from threading import Lock
+from collections import OrderedDict
+from requests import Response
+
+type CacheKey = tuple[str, str, str, bytes | None]
+
+
+
+def cache_key(
+    url: str, headers: dict = None, parameters: dict = None, body: bytes = None
+) -> CacheKey:
+    """Builds a hashable key identifying a GET request.
+
+    :param str url: full API endpoint URL
+    :param dict headers: request headers, defaults to None
+    :param dict parameters: query string parameters, defaults to None
+    :param bytes body: encoded request payload, defaults to None
+    :return CacheKey: key for `ResponseCache`
+    """
+    return (
+        url,
+        json.dumps(headers or {}, sort_keys=True, default=str),
+        json.dumps(parameters or {}, sort_keys=True, default=str),
+        body,
+    )
+
+
+class ResponseCache:
+    """# Least recently used cache of successful GET responses
+
+    Dependent requests frequently resolve to the same endpoint more than once within a single integration run.
+    Responses marked with `Cache-Control: no-store`, or with bodies larger than `max_body_size` bytes, are never stored.
+    Expired entries are kept until evicted, so they can still be revalidated by `ETag`.
+    """
+
+    def __init__(self, maxsize: int = 256, max_body_size: int = 1 << 20):
+        self.maxsize = maxsize
+        self.max_body_size = max_body_size
+        self.entries: OrderedDict[CacheKey, tuple[float, Response]] = OrderedDict()
+        self.lock = Lock()
+
+    def get(self, key: CacheKey, ttl: float = None) -> Response | None:
+        """Looks up a cached response.
+
+        :param CacheKey key: request key, see `cache_key`
+        :param float ttl: maximum age of the cached response in seconds, `0` always misses, defaults to None (no expiry)
+        :return Response | None: cached response, if any
+        """
+        with self.lock:
+            if key not in self.entries:
+                return None
+            stored_at, response = self.entries[key]
+            if ttl is not None and monotonic() - stored_at >= ttl:
+                return None
+            self.entries.move_to_end(key)
+            return response
+
+    def set(self, key: CacheKey, response: Response):
+        """Stores `response` under `key`, evicting the least recently used entry when full.
+
+        :param CacheKey key: request key, see `cache_key`
+        :param Response response: response to cache
+        """
+        if response.status_code != 200:
+            return
+        if "no-store" in response.headers.get("Cache-Control", "").lower():
+            return
+        if len(response.content) > self.max_body_size:
+            return
+        with self.lock:
+            self.entries[key] = (monotonic(), response)
+            self.entries.move_to_end(key)
+            if len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+
+RESPONSE_CACHE = ResponseCache()
@@ -1,53 +1,42 @@
+import re
+import json
+from operator import getitem
+from functools import lru_cache, reduce
+from itertools import product
+from concurrent.futures import ThreadPoolExecutor
 import pydie.rest.interfaces as rest
+from pydie.rest.cache import RESPONSE_CACHE, cache_key
 from requests import Response
-from pydie.utils import get_nested_value, parse_path_parameters, inject_parameter_values
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def fetcher(
-    configuration: rest.FetcherConfiguration,
-    engine_configuration: rest.EngineConfiguration,
-) -> rest.ConverterConfiguration:
-    request_function = rest.REQUEST_FUNCTIONS[configuration["request_function_name"]]
-    response: Response = request_function(
-        url=configuration["id"], **configuration["request_function_parameters"]
-    )
-    if response.status_code != 200:
-        raise BaseException(
-            f"Failed request to [{configuration['id']}] (status {response.status_code}).\n"
-            + f"Details: {response.reason}."
-        )
-    data = response.json()
-    dependent_requests = extract_parametrizable_properties_into_dependent_requests(
-        data=data,
-        parametrizable_properties=configuration["response_parametrizable_properties"],
-    )
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
-    return {
-        "dependent_requests_parameters": dependent_requests,
-        "target_table": configuration["target_table"],
-    }
 
+class FetchError(Exception):
+    """Raised when a REST API responds with a non-2xx status."""
 
-def extract_parametrizable_properties_into_dependent_requests(
-    data: dict, parametrizable_properties: rest.ParametrizablePropertyMapping
-) -> rest.DependentRequestMapping:
-    dependent_requests: rest.DependentRequestMapping = dict()
-    for parameter_key, property in parametrizable_properties.items():
-        fetcher_id = property["fetcher_id"]
-        if fetcher_id not in dependent_requests:
-            dependent_requests[fetcher_id] = {"id": fetcher_id, "parameters": dict()}
-        data_at_address = get_data_at_address(data=data, address=property["address"])
-        dependent_requests[fetcher_id]["parameters"].update(
-            {
-                property["parameter_key"]: data_at_address
-                if isinstance(data_at_address, list)
-                else [data_at_address]
-            }
+    def __init__(self, url: str, status_code: int, reason: str):
+        super().__init__(
+            f"Failed request to [{url}] (status {status_code}).\n"
+            + f"Details: {reason}."
         )
-        dependent_fetcher_id = inject_parameter_values(path=fetcher_id)
-        property["fetcher_id"]
-        property["parameter_key"]
-    # TODO, set target table to raw (unparametrized) FetcherID
+        self.url = url
+        self.status_code = status_code
+        self.reason = reason
+
+
+# Requests kept in flight when the engine does not set `default_concurrency`.
+DEFAULT_CONCURRENCY = 32
+
+# Matches `{parameter_name}` placeholders in API paths.
+PATH_PARAMETER_PATTERN = re.compile(r"\{([^}]+)\}")
 
 
 def path_maker(
@@ -62,15 +51,32 @@ def path_maker(
     :param list[ParametrizableResponseProperty] path_parameters: ID replacements, defaults to None
     :return str: full API enpoint URL
     """
-    formatted_path = path
-    if path_parameters is not None:
-        for parameter_name, parameter_value in path_parameters.items():
-            formatted_path = formatted_path.replace(
-                "{" + parameter_name + "}", parameter_value
-            )
+    segments = path_template(path)
+    if not path_parameters or len(segments) == 1:
+        return f"{base_url}{path}"
+    formatted_path = "".join(
+        (
+            segment
+            if index % 2 == 0
+            else str(path_parameters.get(segment, "{" + segment + "}"))
+        )
+        for index, segment in enumerate(segments)
+    )
     return f"{base_url}{formatted_path}"
 
 
+@lru_cache(maxsize=1024)
+def path_template(path: str) -> tuple[str, ...]:
+    """Splits an API path into alternating literal segments and parameter names.
+
+    Cached per path, so each distinct path is only scanned once.
+
+    :param str path: API path
+    :return tuple[str, ...]: literal segments at even indexes, parameter names at odd indexes
+    """
+    return tuple(PATH_PARAMETER_PATTERN.split(path))
+
+
 def dependency_injector(
     response_properties: rest.ResponsePropertiesToParametrize,
     dependent_requests: dict[rest.Path, rest.FetcherConfiguration],
@@ -78,47 +84,120 @@ def dependency_injector(
 ) -> dict[rest.Path, rest.FetcherConfiguration]:
     """Extracts `response_properties` from `response_data` and injects them into `dependent_requests`.
 
+    Repeated values are only injected once, keeping the order in which they first appear.
+
     :param rest.ResponsePropertiesToParametrize response_properties: properties in `response_data` to be parametrized into dependent requests
     :param dict[rest.Path, rest.FetcherConfiguration] dependent_requests: requests that depend on values from `response_data`
-    :param rest.ResponseData response_data: response data from parent request
-    :return dict[rest.Path, rest.FetcherConfiguration]:
+    :param rest.ResponseData response_data: response data from parent request, `None` when the response had no body
+    :return dict[rest.Path, rest.FetcherConfiguration]: copies of `dependent_requests` with the injected values
     """
+    dependent_requests = {
+        path: {
+            **request,
+            "parametrizable_values": dict(request.get("parametrizable_values") or {}),
+        }
+        for path, request in dependent_requests.items()
+    }
+    # Missing data injects no values, so parametrized dependents produce no requests.
+    data_at_address: dict[tuple | None, list[dict]] = dict()
     for path, property in response_properties.items():
-        data: list[dict] = get_data_at_address(
-            data=response_data, address=property["parametrizable_proterty_address"]
-        )
+        address = property["parametrizable_proterty_address"]
+        address_key = None if address is None else tuple(address)
+        if address_key not in data_at_address:
+            data_at_address[address_key] = (
+                get_data_at_address(data=response_data, address=address) or []
+            )
+        data = data_at_address[address_key]
         key = property["parametrizable_key"]
         parameter_name = property["path_parameter_name"]
 
         if "target_table" not in dependent_requests[path]:
             dependent_requests[path]["target_table"] = path
-        if dependent_requests[path]["parametrizable_values"] is None:
-            dependent_requests[path]["parametrizable_values"] = dict()
         dependent_requests[path]["parametrizable_values"].update(
-            {parameter_name: [v[key] for v in data]}
+            {parameter_name: unique_values([v[key] for v in data])}
         )
     return dependent_requests
 
 
+def unique_values(values: list) -> list:
+    """Drops repeated values, keeping the order in which they first appear.
+
+    Hashable values are deduplicated in linear time; unhashable ones (e.g. lists or dicts) fall back to
+    a quadratic scan.
+
+    :param list values: values to deduplicate
+    :return list: first occurrence of each value
+    """
+    try:
+        return list(dict.fromkeys(values))
+    except TypeError:
+        unique = []
+        for value in values:
+            if value not in unique:
+                unique.append(value)
+        return unique
+
+
 def dependency_extractor(
     converter_configuration: rest.ConverterConfiguration,
+    paths: set[rest.Path] = None,
 ) -> list[rest.FetcherConfiguration]:
     """Splits dependent requests in converter configuration into separate fetcher configurations
 
+    One configuration is made for every combination of parametrizable values of each dependent path.
+    Combinations resolving to the same path and parameters are only requested once.
+
     :param rest.ConverterConfiguration converter_configuration: converter configuration output from a fetcher
+    :param set[rest.Path] paths: only split the dependent requests of these paths, defaults to None (all paths)
     :return list[rest.FetcherConfiguration]:
     """
+    dependent_requests = converter_configuration.get("dependent_requests") or {}
+    fetcher_configurations: dict[tuple, rest.FetcherConfiguration] = dict()
+    for path, request in dependent_requests.items():
+        if paths is not None and path not in paths:
+            continue
+        parametrizable_values = {
+            name: values if isinstance(values, list) else [values]
+            for name, values in (request.get("parametrizable_values") or {}).items()
+        }
+        parameter_names = list(parametrizable_values)
+        for values in product(*(parametrizable_values[n] for n in parameter_names)):
+            path_parameters = dict(zip(parameter_names, values))
+            key = (path, tuple((n, str(v)) for n, v in path_parameters.items()))
+            fetcher_configurations.setdefault(
+                key,
+                {
+                    **request,
+                    "path": request.get("path", path),
+                    "target_table": request.get("target_table", path),
+                    "parametrizable_values": path_parameters,
+                },
+            )
+    return list(fetcher_configurations.values())
+
 
+def static_dependent_paths(connection: rest.FetcherConfiguration) -> set[rest.Path]:
+    """Paths of the dependent GET requests of `connection` that are not parametrized by its response.
 
-def get_data_at_address(data: dict | list, address: rest.ResponsePropertyKey):
-    if address is None or type(data) is list:
+    Those requests do not need to wait for `connection` and can be issued alongside it.
+    Other methods may have side effects, so they always wait for their parent to succeed.
+
+    :param rest.FetcherConfiguration connection: configuration with dependent requests
+    :return set[rest.Path]:
+    """
+    parametrized_paths = connection.get("response_properties_to_parametrize") or {}
+    return {
+        path
+        for path, request in (connection.get("dependent_requests") or {}).items()
+        if path not in parametrized_paths
+        and request.get("request_function_name", "").lower() == "get"
+    }
+
+
+def get_data_at_address(data: dict | list | None, address: rest.ResponsePropertyKey):
+    if address is None or data is None or type(data) is list:
         return data
-    index = 0
-    result = data
-    while index < len(address):
-        result = result[address[index]]
-        index += 1
-    return result
+    return reduce(getitem, address, data)
 
 
 def fetcher(
@@ -128,7 +207,7 @@ def fetcher(
 
     :param rest.FetcherConfiguration connection: particular API path endpiont to connect to
     :param rest.EngineConfiguration engine: general REST API configurations
-    :raises BaseException: on `status_code!=200`
+    :raises FetchError: on non-2xx `status_code`
     :return rest.ConverterConfiguration: specifications to be fed into a converter
     """
     url = path_maker(
@@ -137,28 +216,252 @@ def fetcher(
         path_parameters=connection.get("parametrizable_values"),
     )
 
-    connection.get("request_function_parameters", {}).get("headers", {}).update(
-        engine["default_headers"]
+    address = connection.get("top_level_data_address")
+    stream = engine.get("stream_responses", False) and is_streamable(address)
+
+    request_function_parameters = connection.get("request_function_parameters", {})
+    response = send_request(
+        method=connection["request_function_name"],
+        url=url,
+        headers=headers_maker(connection=connection, engine=engine),
+        parameters=request_function_parameters.get("parameters"),
+        json=request_function_parameters.get("json"),
+        cache_ttl=engine.get("cache_ttl"),
+        stream=stream,
     )
 
-    response = connection["request_function"](
-        url=url, **connection.get("request_function_parameters", {})
+    with response:
+        if not 200 <= response.status_code < 300:
+            raise FetchError(
+                url=url, status_code=response.status_code, reason=response.reason
+            )
+        if stream and response.status_code != 204:
+            response_data = stream_data_at_address(response=response, address=address)
+        else:
+            response_data = get_data_at_address(
+                data=parse_json(response), address=address
+            )
+
+    return converter_configuration_maker(
+        connection=connection, response_data=response_data
     )
 
-    if response.status_code != 200:
-        raise BaseException(url, response, response.reason)
 
-    response_data = response.json()
+def fetcher_or_none(
+    connection: rest.FetcherConfiguration, engine: rest.EngineConfiguration
+) -> rest.ConverterConfiguration | None:
+    """Same as `fetcher`, but returns `None` instead of raising on failed requests.
+
+    Lets schedulers skip failed endpoints without handling exceptions.
+
+    :param rest.FetcherConfiguration connection: particular API path endpiont to connect to
+    :param rest.EngineConfiguration engine: general REST API configurations
+    :return rest.ConverterConfiguration | None: specifications to be fed into a converter, `None` if the request failed
+    """
+    try:
+        return fetcher(connection, engine)
+    except FetchError:
+        return None
+
+
+def send_request(
+    method: str,
+    url: str,
+    headers: dict = None,
+    parameters: rest.RequestParameters = None,
+    json: rest.RequestJSON = None,
+    cache_ttl: float = None,
+    stream: bool = False,
+) -> Response:
+    """Issues a request through the shared `rest.SESSION`.
+
+    When `cache_ttl` is given, successful GET responses are served from `RESPONSE_CACHE` when the same request was already made.
+    Once older than `cache_ttl`, cached responses carrying an `ETag` are revalidated with `If-None-Match`,
+    so a `cache_ttl` of `0` revalidates on every request.
+    JSON payloads, GET ones included, are serialized with `encode_json`.
+
+    :param str method: HTTP method name (get, put, post, delete)
+    :param str url: full API endpoint URL
+    :param dict headers: request headers, defaults to None
+    :param rest.RequestParameters parameters: query string parameters, defaults to None
+    :param rest.RequestJSON json: JSON payload, defaults to None
+    :param float cache_ttl: maximum age of a cached GET response in seconds, defaults to None (no caching)
+    :param bool stream: leave the body unread, bypassing the cache, defaults to False
+    :return Response: response to the request
+    """
+    data = None
+    if json is not None:
+        headers = {"Content-Type": "application/json", **(headers or {})}
+        data = encode_json(json)
+
+    if method.lower() != "get":
+        return rest.SESSION.request(
+            method.upper(),
+            url,
+            headers=headers,
+            params=parameters,
+            data=data,
+            stream=stream,
+        )
 
-    if "top_level_data_address" in connection:
-        response_data = get_data_at_address(
-            data=response_data, address=connection["top_level_data_address"]
+    if stream or cache_ttl is None:
+        return rest.SESSION.get(
+            url, headers=headers, params=parameters, data=data, stream=stream
         )
 
+    key = cache_key(url=url, headers=headers, parameters=parameters, body=data)
+    response = RESPONSE_CACHE.get(key, ttl=cache_ttl)
+    if response is not None:
+        return response
+
+    stale_response = RESPONSE_CACHE.get(key)
+    if stale_response is not None and "ETag" in stale_response.headers:
+        headers = {**(headers or {}), "If-None-Match": stale_response.headers["ETag"]}
+
+    response = rest.SESSION.get(url, headers=headers, params=parameters, data=data)
+    if response.status_code == 304 and stale_response is not None:
+        response = stale_response
+    RESPONSE_CACHE.set(key, response)
+    return response
+
+
+def parse_json(response: Response) -> rest.ResponseData | None:
+    """Decodes a JSON response body, see `decode_json`.
+
+    :param Response response: response with a JSON body
+    :return rest.ResponseData | None: decoded response JSON, `None` for 204 or empty responses
+    """
+    if response.status_code == 204:
+        return None
+    return decode_json(response.content)
+
+
+# Byte order mark some APIs prefix UTF-8 bodies with, which `orjson` rejects.
+UTF8_BOM = b"\xef\xbb\xbf"
+
+# Runs of digits long enough to overflow 64 bit integers, which `orjson` decodes as floats.
+WIDE_INTEGER_PATTERN = re.compile(rb"\d{19,}")
+
+
+def decode_json(body: bytes) -> rest.ResponseData | None:
+    """Decodes a JSON body with `orjson`, which is considerably faster than the standard library.
+
+    Falls back to `json` when `orjson` is not installed, when it rejects the body (e.g. `NaN` literals),
+    and for bodies with integers that may be wider than 64 bits, which `json` keeps exact.
+
+    :param bytes body: raw response body
+    :return rest.ResponseData | None: decoded JSON, `None` for an empty body
+    """
+    body = body.removeprefix(UTF8_BOM)
+    if not body:
+        return None
+    if orjson is None or WIDE_INTEGER_PATTERN.search(body):
+        return json.loads(body)
+    try:
+        return orjson.loads(body)
+    except orjson.JSONDecodeError:
+        return json.loads(body)
+
+
+def encode_json(data: rest.RequestJSON) -> bytes:
+    """Encodes a JSON payload with `orjson`, when installed.
+
+    Falls back to `json` for payloads `orjson` rejects, such as integers wider than 64 bits.
+
+    :param rest.RequestJSON data: JSON payload
+    :return bytes: encoded payload
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+    return json.dumps(data, separators=(",", ":")).encode()
+
+
+def is_streamable(address: rest.ResponsePropertyKey) -> bool:
+    """Whether the data at `address` can be extracted from a streamed body with `ijson`.
+
+    `ijson` prefixes can only address object keys, and `ijson` must be installed.
+    Prefixes are dot separated and name array elements `item`, so keys containing a dot or named `item`
+    would be ambiguous and are not streamed.
+
+    :param rest.ResponsePropertyKey address: address of the data in the response
+    :return bool:
+    """
+    return (
+        ijson is not None
+        and bool(address)
+        and all(
+            isinstance(key, str) and "." not in key and key != "item" for key in address
+        )
+    )
+
+
+def stream_data_at_address(
+    response: Response, address: rest.ResponsePropertyKey
+) -> rest.ResponseData:
+    """Decodes only the data at `address` out of a streamed JSON response body.
+
+    The rest of the body is parsed but never materialized, which keeps peak memory low when
+    a large array is wrapped in a small envelope. Only object bodies are supported.
+
+    :param Response response: response requested with `stream=True`
+    :param rest.ResponsePropertyKey address: address of the data in the response, see `is_streamable`
+    :raises KeyError: when the body has no data at `address`, e.g. when it is a top level array
+    :return rest.ResponseData: decoded data at `address`, `None` for an empty body, like `parse_json`
+    """
+    response.raw.decode_content = True
+    missing = object()
+    try:
+        data = next(
+            ijson.items(response.raw, ".".join(address), use_float=True), missing
+        )
+    except ijson.IncompleteJSONError:
+        if response.raw.tell() == 0:
+            return None
+        raise
+    if data is missing:
+        raise KeyError(
+            f"No data at address {address} in the streamed response from [{response.url}]."
+            + " Streamed responses must be JSON objects."
+        )
+    return data
+
+
+def headers_maker(
+    connection: rest.FetcherConfiguration, engine: rest.EngineConfiguration
+) -> dict:
+    """Merges the engine's default headers with the connection's own headers.
+
+    Neither configuration is mutated, so the same configurations can be fetched repeatedly or concurrently.
+    Connection headers take precedence over the engine defaults.
+
+    :param rest.FetcherConfiguration connection: particular API path endpiont to connect to
+    :param rest.EngineConfiguration engine: general REST API configurations
+    :return dict: request headers
+    """
+    return {
+        **(engine.get("default_headers") or {}),
+        **(connection.get("request_function_parameters", {}).get("headers") or {}),
+    }
+
+
+def converter_configuration_maker(
+    connection: rest.FetcherConfiguration, response_data: rest.ResponseData
+) -> rest.ConverterConfiguration:
+    """Builds the converter configuration out of an already decoded response.
+
+    Shared by the synchronous and asynchronous fetchers.
+
+    :param rest.FetcherConfiguration connection: configuration used for the request
+    :param rest.ResponseData response_data: decoded response JSON, at the connection's `top_level_data_address`
+    :return rest.ConverterConfiguration: specifications to be fed into a converter
+    """
     dependencies = dependency_injector(
         response_data=response_data,
-        response_properties=connection["response_properties_to_parametrize"],
-        dependent_requests=connection["dependent_requests"],
+        response_properties=connection.get("response_properties_to_parametrize", {}),
+        dependent_requests=connection.get("dependent_requests", {}),
     )
 
     return {
@@ -168,6 +471,47 @@ def fetcher(
     }
 
 
+def parallel_fetch(
+    connections: list[rest.FetcherConfiguration],
+    engine: rest.EngineConfiguration,
+    max_workers: int = None,
+) -> list[rest.ConverterConfiguration | None]:
+    """Runs `fetcher_or_none` for every connection on a thread pool.
+
+    `requests` releases the GIL while waiting on the network, so requests overlap without an event loop.
+    A failed request yields `None` instead of discarding its siblings, as in `async_fetchers.gather_fetches`.
+
+    :param list[rest.FetcherConfiguration] connections: endpoints to fetch
+    :param rest.EngineConfiguration engine: general REST API configurations
+    :param int max_workers: maximum number of requests in flight, defaults to the engine's `default_concurrency` or `DEFAULT_CONCURRENCY`
+    :return list[rest.ConverterConfiguration | None]: converter configurations, in the same order as `connections`, `None` for failed requests
+    """
+    max_workers = (
+        max_workers or engine.get("default_concurrency") or DEFAULT_CONCURRENCY
+    )
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(
+            executor.map(
+                lambda connection: fetcher_or_none(connection, engine), connections
+            )
+        )
+
+
+def parallel_fetch_dependencies(
+    converter_configuration: rest.ConverterConfiguration,
+    engine: rest.EngineConfiguration,
+) -> list[rest.ConverterConfiguration | None]:
+    """Fetches every dependent request of `converter_configuration` on a thread pool.
+
+    :param rest.ConverterConfiguration converter_configuration: converter configuration output from a fetcher
+    :param rest.EngineConfiguration engine: general REST API configurations
+    :return list[rest.ConverterConfiguration | None]: converter configurations of the dependent requests, `None` for failed requests
+    """
+    return parallel_fetch(
+        connections=dependency_extractor(converter_configuration), engine=engine
+    )
+
+
 def dependent_fetcher(
     connection: rest.FetcherConfiguration, engine: rest.EngineConfiguration
 ) -> rest.ConverterConfiguration: ...
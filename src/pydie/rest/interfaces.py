@@ -1,6 +1,8 @@
 import pydie.interfaces as interfaces
 from typing import Optional, TypedDict, Protocol
-from requests import Response, get, put, post, delete
+from requests import Response, Session
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 
 
 class APIPath:
@@ -44,37 +46,60 @@ class RequestFunction(Protocol):
     ) -> Response: ...
 
 
-REQUEST_FUNCTIONS = {"get": get, "put": put, "post": post, "delete": delete}
+# Shared across fetchers so that connections to the same host are pooled and kept alive.
+SESSION = Session()
+ADAPTER = HTTPAdapter(
+    pool_connections=20,
+    pool_maxsize=100,
+    max_retries=Retry(total=3, backoff_factor=0.1),
+)
+SESSION.mount("http://", ADAPTER)
+SESSION.mount("https://", ADAPTER)
 
 
-class ParametrizableProperty(TypedDict):
-    parameter_key: APIPath.ParameterKey
-    address: list[int]
-    fetcher_id: interfaces.FetcherID
+type Path = str
+type PathParameterName = APIPath.ParameterKey
+type ParametrizableValue = APIPath.ParameterValue
+type ResponsePropertyKey = list[str | int]
 
 
-class DependentRequest(TypedDict):
-    id: interfaces.FetcherID
-    parameters: dict[APIPath.ParameterKey, list[APIPath.ParameterValue]]
+class ParametrizableResponseProperty(TypedDict):
+    """Property of a response whose values parametrize the path of a dependent request."""
 
+    parametrizable_proterty_address: Optional[ResponsePropertyKey]
+    parametrizable_key: str
+    path_parameter_name: PathParameterName
 
-type ParametrizablePropertyMapping = dict[APIPath.ParameterKey, ParametrizableProperty]
-type DependentRequestMapping = dict[interfaces.FetcherID, DependentRequest]
+
+type ResponsePropertiesToParametrize = dict[Path, ParametrizableResponseProperty]
 
 
 class FetcherConfiguration(interfaces.FetcherConfiguration):
     """
-    The `id` property (`FetcherID` type) should be a valid api endpoint.
+    The `path` property is appended to the engine's `base_url`, with its `{parameter}` placeholders
+    replaced by `parametrizable_values`.
     """
 
+    path: Path
     request_function_parameters: RequestFunctionParameters
     request_function_name: str
-    response_parametrizable_properties: Optional[ParametrizablePropertyMapping]
+    parametrizable_values: Optional[
+        dict[PathParameterName, ParametrizableValue | list[ParametrizableValue]]
+    ]
+    top_level_data_address: Optional[ResponsePropertyKey]
+    response_properties_to_parametrize: Optional[ResponsePropertiesToParametrize]
+    dependent_requests: Optional[dict[Path, "FetcherConfiguration"]]
 
 
 class ConverterConfiguration(interfaces.FetcherConfiguration):
-    dependent_requests_parameters: Optional[DependentRequestMapping]
+    data: ResponseData
+    dependent_requests: dict[Path, FetcherConfiguration]
 
 
 class EngineConfiguration(interfaces.EngineConfiguration):
     base_url: str
+    default_headers: Optional[dict]
+    cache_ttl: Optional[float]
+    default_concurrency: Optional[int]
+    stream_responses: Optional[bool]
+    prefetch: Optional[bool]
@@ -0,0 +1,68 @@
+from itertools import islice
+from typing import Iterable, Iterator, TYPE_CHECKING
+from pydie.interfaces import SQLTableName
+
+if TYPE_CHECKING:
+    from pyodbc import Connection
+
+
+def batches(rows: Iterable[tuple], batch_size: int) -> Iterator[list[tuple]]:
+    """Lazily groups `rows` into lists of at most `batch_size` rows.
+
+    :param Iterable[tuple] rows: rows to group
+    :param int batch_size: maximum number of rows per batch
+    :return Iterator[list[tuple]]:
+    """
+    iterator = iter(rows)
+    while batch := list(islice(iterator, batch_size)):
+        yield batch
+
+
+def quote_identifier(name: str) -> str:
+    """Quotes a SQL Server identifier, so it can be safely interpolated into a statement.
+
+    :param str name: table or column name
+    :return str: bracket quoted identifier
+    """
+    return "[" + name.replace("]", "]]") + "]"
+
+
+def insert_rows(
+    connection: "Connection",
+    table: SQLTableName,
+    columns: list[str],
+    rows: Iterable[tuple],
+    batch_size: int = 10_000,
+) -> int:
+    """# Batched SQL insert
+
+    Uses `pyodbc`'s `fast_executemany`, which sends a whole batch of parameters in a single round trip instead of one per row.
+    `rows` is consumed lazily, so a generator (e.g. `polars.DataFrame.iter_rows()`) is never fully materialized.
+    The transaction is rolled back if any batch fails.
+
+    :param Connection connection: open database connection
+    :param SQLTableName table: table to insert into, optionally qualified by its schema (e.g. `dbo.orders`)
+    :param list[str] columns: column names, in the same order as the values in each row
+    :param Iterable[tuple] rows: rows to insert
+    :param int batch_size: number of rows sent per round trip, defaults to 10_000
+    :return int: number of inserted rows
+    """
+    statement = (
+        f"INSERT INTO {'.'.join(quote_identifier(part) for part in table.split('.'))} "
+        + f"({', '.join(quote_identifier(column) for column in columns)}) "
+        + f"VALUES ({', '.join('?' for _ in columns)})"
+    )
+    inserted = 0
+    cursor = connection.cursor()
+    cursor.fast_executemany = True
+    try:
+        for batch in batches(rows=rows, batch_size=batch_size):
+            cursor.executemany(statement, batch)
+            inserted += len(batch)
+        connection.commit()
+    except Exception:
+        connection.rollback()
+        raise
+    finally:
+        cursor.close()
+    return inserted
@@ -0,0 +1,507 @@
+import io
+import time
+import asyncio
+import pytest
+from requests import Response
+import pydie.rest.interfaces as rest
+import pydie.rest.fetchers as fetchers
+from pydie.rest.cache import RESPONSE_CACHE, ResponseCache
+import pydie.rest.async_fetchers as async_fetchers
+from pydie.rest.fetchers import (
+    path_maker,
+    headers_maker,
+    dependency_injector,
+    dependency_extractor,
+    converter_configuration_maker,
+)
+
+ENGINE = {"base_url": "https://api.example.com", "default_headers": {}}
+
+
+def record_levels(monkeypatch) -> list[list[str]]:
+    """Stubs out the network in `async_fetchers` and records the paths fetched in each level."""
+    levels = []
+    gather_fetches = async_fetchers.gather_fetches
+
+    async def fake_fetcher_async(connection, engine, session):
+        return converter_configuration_maker(connection=connection, response_data=[])
+
+    async def recording_gather_fetches(connections, engine, session, semaphore):
+        levels.append([connection["path"] for connection in connections])
+        return await gather_fetches(connections, engine, session, semaphore)
+
+    monkeypatch.setattr(async_fetchers, "fetcher_async", fake_fetcher_async)
+    monkeypatch.setattr(async_fetchers, "gather_fetches", recording_gather_fetches)
+    return levels
+
+
+def test_fetch_all_prefetches_static_get_dependents_only(monkeypatch):
+    levels = record_levels(monkeypatch)
+    orders = {
+        "path": "/orders",
+        "target_table": "orders",
+        "request_function_name": "get",
+        "dependent_requests": {
+            "/customers": {"request_function_name": "get"},
+            "/audit": {"request_function_name": "post"},
+        },
+    }
+
+    asyncio.run(async_fetchers.fetch_all([orders], ENGINE))
+
+    assert levels == [["/orders", "/customers"], ["/audit"]]
+
+
+def test_fetch_all_without_prefetch_waits_for_parent(monkeypatch):
+    levels = record_levels(monkeypatch)
+    orders = {
+        "path": "/orders",
+        "target_table": "orders",
+        "request_function_name": "get",
+        "dependent_requests": {"/customers": {"request_function_name": "get"}},
+    }
+
+    asyncio.run(async_fetchers.fetch_all([orders], {**ENGINE, "prefetch": False}))
+
+    assert levels == [["/orders"], ["/customers"]]
+
+
+def make_response(status_code: int, content: bytes = b"", headers: dict = None):
+    response = Response()
+    response.status_code = status_code
+    response._content = content
+    response._content_consumed = True
+    response.headers.update(headers or {})
+    return response
+
+
+def test_fetcher_treats_no_content_as_none(monkeypatch):
+    monkeypatch.setattr(fetchers, "send_request", lambda **_: make_response(204))
+    connection = {
+        "path": "/orders",
+        "target_table": "orders",
+        "request_function_name": "get",
+        "top_level_data_address": ["data"],
+    }
+
+    converter = fetchers.fetcher_or_none(connection, ENGINE)
+
+    assert converter is not None
+    assert converter["data"] is None
+
+
+def test_parse_json_treats_empty_body_as_none():
+    assert fetchers.parse_json(make_response(200)) is None
+    assert fetchers.parse_json(make_response(200, b'{"a": 1}')) == {"a": 1}
+
+
+def test_dependency_injector_tolerates_none_response_data():
+    dependents = dependency_injector(
+        response_properties={
+            "/customers/{id}": {
+                "parametrizable_proterty_address": ["data"],
+                "parametrizable_key": "customer_id",
+                "path_parameter_name": "id",
+            }
+        },
+        dependent_requests={"/customers/{id}": {"request_function_name": "get"}},
+        response_data=None,
+    )
+
+    assert dependents["/customers/{id}"]["parametrizable_values"] == {"id": []}
+
+
+def stub_session_get(monkeypatch, *responses: Response) -> list[dict]:
+    """Makes `rest.SESSION.get` return `responses` in order and records the headers of each call."""
+    calls = []
+    remaining = list(responses)
+
+    def get(url, headers=None, params=None, data=None, stream=False):
+        calls.append({**(headers or {}), "data": data})
+        return remaining.pop(0)
+
+    RESPONSE_CACHE.clear()
+    monkeypatch.setattr(rest.SESSION, "get", get)
+    return calls
+
+
+def test_send_request_caches_only_with_cache_ttl(monkeypatch):
+    url = "https://api.example.com/orders"
+    calls = stub_session_get(
+        monkeypatch, make_response(200, b"[]"), make_response(200, b"[]")
+    )
+    fetchers.send_request("get", url)
+    fetchers.send_request("get", url)
+    assert len(calls) == 2
+
+    calls = stub_session_get(monkeypatch, make_response(200, b"[]"))
+    fetchers.send_request("get", url, cache_ttl=60)
+    fetchers.send_request("get", url, cache_ttl=60)
+    assert len(calls) == 1
+
+
+def test_response_cache_skips_large_bodies():
+    cache = ResponseCache(max_body_size=2)
+    cache.set(("small",), make_response(200, b"[]"))
+    cache.set(("large",), make_response(200, b"[1]"))
+
+    assert cache.get(("small",)) is not None
+    assert cache.get(("large",)) is None
+
+
+def test_send_request_reuses_cached_response_on_not_modified(monkeypatch):
+    url = "https://api.example.com/orders"
+    cached = make_response(200, b"[1]", {"ETag": '"v1"'})
+    calls = stub_session_get(monkeypatch, cached, make_response(304))
+
+    fetchers.send_request("get", url, cache_ttl=0)
+    response = fetchers.send_request("get", url, cache_ttl=0)
+
+    assert calls[1]["If-None-Match"] == '"v1"'
+    assert response is cached
+
+
+def test_send_request_replaces_cached_response_on_change(monkeypatch):
+    url = "https://api.example.com/orders"
+    changed = make_response(200, b"[2]", {"ETag": '"v2"'})
+    calls = stub_session_get(
+        monkeypatch, make_response(200, b"[1]", {"ETag": '"v1"'}), changed
+    )
+
+    fetchers.send_request("get", url, cache_ttl=0)
+    response = fetchers.send_request("get", url, cache_ttl=0)
+    fetchers.send_request("get", url, cache_ttl=60)
+
+    assert response is changed
+    assert len(calls) == 2
+
+
+def test_send_request_does_not_cache_no_store(monkeypatch):
+    url = "https://api.example.com/orders"
+    calls = stub_session_get(
+        monkeypatch,
+        make_response(200, b"[1]", {"ETag": '"v1"', "Cache-Control": "no-store"}),
+        make_response(200, b"[1]"),
+    )
+
+    fetchers.send_request("get", url, cache_ttl=60)
+    fetchers.send_request("get", url, cache_ttl=60)
+
+    assert len(calls) == 2
+    assert "If-None-Match" not in calls[1]
+
+
+def test_path_maker_keeps_unknown_placeholders():
+    url = path_maker(
+        base_url="https://api.example.com",
+        path="/orders/{order_id}/items/{item_id}",
+        path_parameters={"order_id": 7},
+    )
+
+    assert url == "https://api.example.com/orders/7/items/{item_id}"
+
+
+def test_path_maker_substitutes_repeated_placeholders():
+    url = path_maker(
+        base_url="https://api.example.com",
+        path="/users/{id}/friends/{id}",
+        path_parameters={"id": 3},
+    )
+
+    assert url == "https://api.example.com/users/3/friends/3"
+
+
+def test_dependency_extractor_does_not_split_scalars():
+    configurations = dependency_extractor(
+        {
+            "dependent_requests": {
+                "/orders/{id}": {"parametrizable_values": {"id": "42"}}
+            }
+        }
+    )
+
+    assert [c["parametrizable_values"] for c in configurations] == [{"id": "42"}]
+
+
+def test_dependency_extractor_collapses_equivalent_values():
+    configurations = dependency_extractor(
+        {
+            "dependent_requests": {
+                "/orders/{id}": {"parametrizable_values": {"id": [1, "1", 2]}}
+            }
+        }
+    )
+
+    assert [c["parametrizable_values"] for c in configurations] == [
+        {"id": 1},
+        {"id": 2},
+    ]
+
+
+def test_dependency_extractor_skips_empty_values():
+    configurations = dependency_extractor(
+        {"dependent_requests": {"/orders/{id}": {"parametrizable_values": {"id": []}}}}
+    )
+
+    assert configurations == []
+
+
+def test_dependency_injector_does_not_mutate_input():
+    dependent_requests = {
+        "/customers/{id}": {"request_function_name": "get", "path": "/customers/{id}"}
+    }
+    response_properties = {
+        "/customers/{id}": {
+            "parametrizable_proterty_address": None,
+            "parametrizable_key": "customer_id",
+            "path_parameter_name": "id",
+        }
+    }
+
+    dependents = dependency_injector(
+        response_properties=response_properties,
+        dependent_requests=dependent_requests,
+        response_data=[{"customer_id": 1}, {"customer_id": 1}, {"customer_id": 2}],
+    )
+
+    assert dependents["/customers/{id}"]["parametrizable_values"] == {"id": [1, 2]}
+    assert dependent_requests == {
+        "/customers/{id}": {"request_function_name": "get", "path": "/customers/{id}"}
+    }
+
+
+def test_stream_data_at_address_reads_nested_items():
+    response = make_response(200)
+    response.raw = io.BytesIO(b'{"meta": {}, "data": {"items": [1, 2.5]}}')
+
+    data = fetchers.stream_data_at_address(response=response, address=["data", "items"])
+
+    assert data == [1, 2.5]
+
+
+def test_stream_data_at_address_raises_on_missing_address():
+    response = make_response(200)
+    response.raw = io.BytesIO(b'[{"data": {"items": [1]}}]')
+
+    with pytest.raises(KeyError):
+        fetchers.stream_data_at_address(response=response, address=["data", "items"])
+
+
+def test_encode_json_accepts_non_str_keys_and_wide_integers():
+    assert fetchers.encode_json({1: "a"}) == b'{"1":"a"}'
+    assert fetchers.encode_json({"id": 2**64}) == b'{"id":18446744073709551616}'
+
+
+def test_fetch_all_skips_failed_requests_and_their_dependents(monkeypatch):
+    fetched = []
+
+    async def failing_fetcher_async(connection, engine, session):
+        fetched.append(connection["path"])
+        if connection["path"] == "/orders":
+            raise fetchers.FetchError(
+                url=connection["path"], status_code=500, reason=""
+            )
+        return converter_configuration_maker(connection=connection, response_data=[])
+
+    monkeypatch.setattr(async_fetchers, "fetcher_async", failing_fetcher_async)
+    orders = {
+        "path": "/orders",
+        "target_table": "orders",
+        "request_function_name": "get",
+        "dependent_requests": {"/audit": {"request_function_name": "post"}},
+    }
+    customers = {
+        "path": "/customers",
+        "target_table": "customers",
+        "request_function_name": "get",
+    }
+
+    converters = asyncio.run(async_fetchers.fetch_all([orders, customers], ENGINE))
+
+    assert fetched == ["/orders", "/customers"]
+    assert [converter["target_table"] for converter in converters] == ["customers"]
+
+
+def test_decode_json_keeps_wide_integers_exact():
+    assert fetchers.decode_json(b'{"id": 18446744073709551616}') == {
+        "id": 18446744073709551616
+    }
+    assert fetchers.decode_json(b'{"id": -9223372036854775809}') == {
+        "id": -9223372036854775809
+    }
+
+
+def test_decode_json_strips_byte_order_mark():
+    assert fetchers.decode_json(b'\xef\xbb\xbf{"a": 1}') == {"a": 1}
+    assert fetchers.decode_json(b"\xef\xbb\xbf") is None
+
+
+def test_stream_data_at_address_treats_empty_body_as_none():
+    response = make_response(200)
+    response.raw = io.BytesIO(b"")
+
+    assert fetchers.stream_data_at_address(response=response, address=["data"]) is None
+
+
+def test_is_streamable_rejects_ambiguous_keys():
+    assert fetchers.is_streamable(["data", "items"])
+    assert not fetchers.is_streamable(["a.b"])
+    assert not fetchers.is_streamable(["data", "item"])
+    assert not fetchers.is_streamable(["data", 0])
+
+
+def test_send_request_forwards_and_caches_get_payloads(monkeypatch):
+    url = "https://api.example.com/search"
+    calls = stub_session_get(
+        monkeypatch, make_response(200, b"[1]"), make_response(200, b"[2]")
+    )
+
+    first = fetchers.send_request("get", url, json={"q": 1}, cache_ttl=60)
+    second = fetchers.send_request("get", url, json={"q": 2}, cache_ttl=60)
+    repeated = fetchers.send_request("get", url, json={"q": 1}, cache_ttl=60)
+
+    assert [call["data"] for call in calls] == [b'{"q":1}', b'{"q":2}']
+    assert calls[0]["Content-Type"] == "application/json"
+    assert first is repeated and first is not second
+
+
+ORDERS = {"path": "/orders", "target_table": "orders", "request_function_name": "get"}
+
+
+def test_fetcher_raises_fetch_error_on_non_2xx(monkeypatch):
+    monkeypatch.setattr(fetchers, "send_request", lambda **_: make_response(404))
+
+    with pytest.raises(fetchers.FetchError) as error:
+        fetchers.fetcher(ORDERS, ENGINE)
+
+    assert error.value.status_code == 404
+    assert error.value.url == "https://api.example.com/orders"
+
+
+def test_fetcher_accepts_created(monkeypatch):
+    monkeypatch.setattr(
+        fetchers, "send_request", lambda **_: make_response(201, b'[{"id": 1}]')
+    )
+
+    assert fetchers.fetcher(ORDERS, ENGINE)["data"] == [{"id": 1}]
+
+
+def test_fetcher_or_none_returns_none_on_failure(monkeypatch):
+    for status_code in (400, 503):
+        monkeypatch.setattr(
+            fetchers, "send_request", lambda **_: make_response(status_code)
+        )
+        assert fetchers.fetcher_or_none(ORDERS, ENGINE) is None
+
+
+def test_headers_maker_prefers_connection_headers_without_mutating():
+    engine = {**ENGINE, "default_headers": {"Accept": "*/*", "X-Client": "pydie"}}
+    connection = {
+        **ORDERS,
+        "request_function_parameters": {"headers": {"Accept": "application/json"}},
+    }
+
+    headers = headers_maker(connection=connection, engine=engine)
+
+    assert headers == {"Accept": "application/json", "X-Client": "pydie"}
+    assert engine["default_headers"] == {"Accept": "*/*", "X-Client": "pydie"}
+    assert connection["request_function_parameters"]["headers"] == {
+        "Accept": "application/json"
+    }
+
+
+def stub_session_request(monkeypatch) -> list[dict]:
+    """Makes `rest.SESSION.request` answer 200 and records the arguments of each call."""
+    calls = []
+
+    def request(method, url, headers=None, params=None, data=None, stream=False):
+        calls.append({"method": method, "headers": headers, "data": data})
+        return make_response(200)
+
+    monkeypatch.setattr(rest.SESSION, "request", request)
+    return calls
+
+
+def test_send_request_encodes_payloads_of_other_methods(monkeypatch):
+    url = "https://api.example.com/orders"
+    calls = stub_session_request(monkeypatch)
+
+    fetchers.send_request("post", url, json={"id": 1})
+    fetchers.send_request("delete", url, headers={"X-Client": "pydie"})
+    fetchers.send_request(
+        "put", url, headers={"Content-Type": "application/merge-patch+json"}, json={}
+    )
+
+    assert calls[0]["method"] == "POST"
+    assert calls[0]["data"] == b'{"id":1}'
+    assert calls[0]["headers"] == {"Content-Type": "application/json"}
+    assert calls[1]["data"] is None
+    assert calls[1]["headers"] == {"X-Client": "pydie"}
+    assert calls[2]["data"] == b"{}"
+    assert calls[2]["headers"] == {"Content-Type": "application/merge-patch+json"}
+
+
+def stub_thread_pool(monkeypatch) -> list[int]:
+    """Stubs out the network for `parallel_fetch` and records the size of each thread pool."""
+    sizes = []
+
+    def slow_fetcher(connection, engine):
+        time.sleep(connection["delay"])
+        return converter_configuration_maker(connection=connection, response_data=[])
+
+    class RecordingThreadPoolExecutor(fetchers.ThreadPoolExecutor):
+        def __init__(self, max_workers):
+            sizes.append(max_workers)
+            super().__init__(max_workers=max_workers)
+
+    monkeypatch.setattr(fetchers, "fetcher", slow_fetcher)
+    monkeypatch.setattr(fetchers, "ThreadPoolExecutor", RecordingThreadPoolExecutor)
+    return sizes
+
+
+def test_parallel_fetch_preserves_order(monkeypatch):
+    stub_thread_pool(monkeypatch)
+    connections = [
+        {**ORDERS, "target_table": str(index), "delay": delay}
+        for index, delay in enumerate([0.03, 0.0, 0.02, 0.01])
+    ]
+
+    converters = fetchers.parallel_fetch(connections, ENGINE)
+
+    assert [converter["target_table"] for converter in converters] == [
+        "0",
+        "1",
+        "2",
+        "3",
+    ]
+
+
+def test_parallel_fetch_resolves_pool_size(monkeypatch):
+    sizes = stub_thread_pool(monkeypatch)
+    connections = [{**ORDERS, "delay": 0}]
+
+    fetchers.parallel_fetch(connections, ENGINE)
+    fetchers.parallel_fetch(connections, {**ENGINE, "default_concurrency": 4})
+    fetchers.parallel_fetch(
+        connections, {**ENGINE, "default_concurrency": 4}, max_workers=2
+    )
+
+    assert sizes == [fetchers.DEFAULT_CONCURRENCY, 4, 2]
+
+
+def test_dependency_injector_deduplicates_unhashable_values():
+    dependents = dependency_injector(
+        response_properties={
+            "/regions/{codes}": {
+                "parametrizable_proterty_address": None,
+                "parametrizable_key": "codes",
+                "path_parameter_name": "codes",
+            }
+        },
+        dependent_requests={"/regions/{codes}": {"request_function_name": "get"}},
+        response_data=[{"codes": ["a", "b"]}, {"codes": ["a", "b"]}, {"codes": []}],
+    )
+
+    assert dependents["/regions/{codes}"]["parametrizable_values"] == {
+        "codes": [["a", "b"], []]
+    }
@@ -0,0 +1,68 @@
+import pytest
+from pydie.sql.integrators import insert_rows, quote_identifier
+
+
+class FakeCursor:
+    def __init__(self, fail_on_batch: int = None):
+        self.fail_on_batch = fail_on_batch
+        self.executed = []
+        self.closed = False
+
+    def executemany(self, statement, batch):
+        if len(self.executed) == self.fail_on_batch:
+            raise RuntimeError("insert failed")
+        self.executed.append((statement, batch))
+
+    def close(self):
+        self.closed = True
+
+
+class FakeConnection:
+    def __init__(self, cursor: FakeCursor):
+        self._cursor = cursor
+        self.committed = False
+        self.rolled_back = False
+
+    def cursor(self):
+        return self._cursor
+
+    def commit(self):
+        self.committed = True
+
+    def rollback(self):
+        self.rolled_back = True
+
+
+def test_quote_identifier_escapes_brackets():
+    assert quote_identifier("orders") == "[orders]"
+    assert quote_identifier("weird]name") == "[weird]]name]"
+
+
+def test_insert_rows_batches_and_quotes_identifiers():
+    cursor = FakeCursor()
+    connection = FakeConnection(cursor)
+
+    inserted = insert_rows(
+        connection,
+        table="dbo.orders",
+        columns=["id", "order.date"],
+        rows=((i, "2024-01-01") for i in range(5)),
+        batch_size=2,
+    )
+
+    assert inserted == 5
+    assert [len(batch) for _, batch in cursor.executed] == [2, 2, 1]
+    assert cursor.executed[0][0] == (
+        "INSERT INTO [dbo].[orders] ([id], [order.date]) VALUES (?, ?)"
+    )
+    assert connection.committed and cursor.closed
+
+
+def test_insert_rows_rolls_back_on_failure():
+    cursor = FakeCursor(fail_on_batch=1)
+    connection = FakeConnection(cursor)
+
+    with pytest.raises(RuntimeError):
+        insert_rows(connection, "orders", ["id"], [(1,), (2,)], batch_size=1)
+
+    assert connection.rolled_back and not connection.committed and cursor.closed